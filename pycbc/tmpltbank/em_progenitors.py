@@ -14,12 +14,12 @@
 # with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import functools
 import math
 import numpy as np
 import pycbc
 import os.path
 import scipy.optimize
-import scipy.interpolate
 import logging
 import sys
 
@@ -49,6 +49,26 @@ def ISCO_eq(r, chi):
     """
     return (r*(r-6))**2-chi**2*(2*r*(3*r+14)-9*chi**2)
 
+# Derivative of the ISCO equation with respect to the radial coordinate
+def ISCO_eq_prime(r, chi):
+    """
+    First derivative of ISCO_eq with respect to the radial
+    coordinate.
+
+    Parameters
+    -----------
+    r: float
+        the radial coordinate in BH mass units
+    chi: float
+        the BH dimensionless spin parameter
+
+    Returns
+    ----------
+    float
+        2*r*(r-6)*(2*r-6)-chi**2*(12*r+28)
+    """
+    return 2*r*(r-6)*(2*r-6)-chi**2*(12*r+28)
+
 # Equation that determines the ISSO radius (in BH mass units) at one of the
 # poles
 def ISSO_eq_at_pole(r, chi):
@@ -105,7 +125,7 @@ def PG_ISSO_eq(r, chi, incl):
     r4 = r2*r2
     three_r = 3*r
     r_minus_2 = r - 2
-    sin_incl2 = (math.sin(incl))**2
+    sin_incl2 = np.sin(incl)**2
 
     X = chi2*(chi2*(3*chi2+4*r*(2*r-3))+r2*(15*r*(r-4)+28))-6*r4*(r2-4)
     Y = chi4 * (chi4+r2*(7 * r * (three_r-4)+36))+6 * r * r_minus_2 * \
@@ -114,64 +134,405 @@ def PG_ISSO_eq(r, chi, incl):
 
     return r4*r4*Z+chi2*sin_incl2*(chi2*sin_incl2*Y-2*r4*X)
 
+# Derivative of the generic ISSO equation with respect to the radial
+# coordinate
+def PG_ISSO_eq_prime(r, chi, incl):
+    """First derivative of PG_ISSO_eq with respect to the radial
+    coordinate.
+
+    Parameters
+    ----------
+    r: float
+        the radial coordinate in BH mass units
+    chi: float
+        the BH dimensionless spin parameter
+    incl: float
+        inclination angle between the BH spin and the orbital angular
+        momentum in radians
+
+    Returns
+    -------
+    float
+        ``r**7*(8*Z+r*Z_prime)+chi**2*(1-cos_incl**2)*(chi**2*(1-cos_incl**2)*Y_prime-2*r**3*(4*X+r*X_prime))``
+        where ``X``, ``Y``, ``Z`` are defined in PG_ISSO_eq and
+        ``X_prime``, ``Y_prime``, ``Z_prime`` are their derivatives
+        with respect to r
+    """
+    chi2 = chi*chi
+    chi4 = chi2*chi2
+    r2 = r*r
+    r4 = r2*r2
+    sin_incl2 = np.sin(incl)**2
+
+    X = chi2*(chi2*(3*chi2+4*r*(2*r-3))+r2*(15*r*(r-4)+28))-6*r4*(r2-4)
+    X_prime = chi2*(chi2*(16*r-12)+r*(60*r*(r-3)+56))-12*r2*r*(3*r2-8)
+    Y_prime = 144*r4*r*(2*r-3)*(r-2)+24*chi2*r2*r*(r*(9*r-10)-8) + \
+        12*chi4*(r*(7*r*(r-1)+6)+chi2*(r-1))
+    Z = ISCO_eq(r, chi)
+    Z_prime = ISCO_eq_prime(r, chi)
+
+    return r4*r2*r*(8*Z+r*Z_prime) + \
+        chi2*sin_incl2*(chi2*sin_incl2*Y_prime-2*r2*r*(4*X+r*X_prime))
+
+# Coefficients of the generic ISSO equation seen as a polynomial in r
+def _PG_ISSO_eq_coefficients(chi, sin_incl2):
+    """
+    Coefficients of PG_ISSO_eq viewed as a degree-12 polynomial
+    in the radial coordinate, from the highest to the lowest
+    power of r.  They depend on the sample parameters only, so
+    they can be evaluated once per sample and reused across all
+    the iterations of a root solver.
+
+    Parameters
+    ----------
+    chi: array
+        the BH dimensionless spin parameter
+    sin_incl2: array
+        the squared sine of the inclination angle between the BH
+        spin and the orbital angular momentum
+
+    Returns
+    -------
+    tuple of arrays
+        the 13 polynomial coefficients
+    """
+    chi2 = chi*chi
+    chi4 = chi2*chi2
+    chi6 = chi4*chi2
+    chi8 = chi4*chi4
+    s = sin_incl2
+    s2 = s*s
+    # The two leading coefficients are the same for every sample, so
+    # plain scalars (which broadcast in the Horner sweeps) are enough
+    return (1.,
+            -12.,
+            36-6*chi2*(1-2*s),
+            -28*chi2,
+            9*chi4-6*s*(5*chi4+8*chi2)+36*chi4*s2,
+            24*chi4*s*(5-6*s),
+            -8*s*(2*chi6+7*chi4)+36*s2*(chi6+4*chi4),
+            24*chi6*s*(1-2*s),
+            -6*chi8*s+(21*chi8-48*chi6)*s2,
+            -28*chi8*s2,
+            6*chi8*(6+chi2)*s2,
+            -12*chi8*chi2*s2,
+            chi8*chi4*s2)
+
+# Horner evaluation of the generic ISSO equation
+def _PG_ISSO_eq_horner(r, coeffs):
+    """
+    Evaluate PG_ISSO_eq at r via Horner's scheme from the
+    coefficients returned by _PG_ISSO_eq_coefficients.
+    """
+    p = coeffs[0]
+    for c in coeffs[1:]:
+        p = p*r+c
+    return p
+
+# Horner evaluation of the radial derivative of the generic ISSO equation
+def _PG_ISSO_eq_horner_prime(r, coeffs):
+    """
+    Evaluate the derivative of PG_ISSO_eq with respect to r via
+    Horner's scheme from the coefficients returned by
+    _PG_ISSO_eq_coefficients.
+    """
+    n = len(coeffs)-1
+    p = n*coeffs[0]
+    for k, c in enumerate(coeffs[1:-1]):
+        p = p*r+(n-1-k)*c
+    return p
+
+# Newton-Raphson iteration over whole arrays of root-finding problems
+def _vec_newton(func, fprime, x0, args=(), tol=1.48e-8, maxiter=50):
+    """
+    Solve an array of independent scalar root-finding problems
+    with Newton-Raphson iterations carried out on the whole array
+    at once, avoiding a Python-level solver call per element.
+    Unlike the vectorized mode of scipy.optimize.newton, this
+    iterates in array mode for any input size (scipy routes
+    single-element arrays through its scalar path, which returns a
+    different tuple and raises on non-convergence) and always
+    reports failures through the returned mask rather than by
+    raising.
+
+    Parameters
+    ----------
+    func: callable
+        the function whose roots are sought; must accept and
+        return arrays
+    fprime: callable
+        the derivative of func with respect to its first argument
+    x0: array
+        the initial guesses
+    args: tuple
+        extra (array) arguments to pass to func and fprime
+    tol: float
+        absolute tolerance on the Newton step
+    maxiter: int
+        maximum number of iterations
+
+    Returns
+    -------
+    x: array
+        the roots
+    converged: bool array
+        whether the iteration converged for each element
+    """
+    x = np.array(x0, dtype=np.float64)
+    converged = np.zeros(x.shape, dtype=bool)
+    # Samples that diverge (or hit a zero derivative) before the caller's
+    # fallback picks them up are expected and reported via the mask, so
+    # the floating-point noise they generate is not worth a warning
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for _ in range(maxiter):
+            delta = func(x, *args)/fprime(x, *args)
+            x -= np.where(converged, 0., delta)
+            converged |= abs(delta) < tol
+            if converged.all():
+                break
+    converged &= np.isfinite(x)
+    return x, converged
+
+# Analytic solution for the ISCO radius
+def ISCO_solution(chi):
+    """
+    Closed-form solution for the radius of the Kerr innermost
+    stable circular orbit (ISCO) from Bardeen, Press, Teukolsky,
+    ApJ 178, 347 (1972).  The spin parameter is signed: positive
+    values denote prograde orbits, negative values retrograde
+    ones.
+
+    Parameters
+    ----------
+    chi: float or array
+        the signed BH dimensionless spin parameter
+
+    Returns
+    -------
+    float or array
+        the radius of the ISCO in BH mass units
+    """
+    chi2 = chi*chi
+    Z1 = 1+np.cbrt(1-chi2)*(np.cbrt(1+chi)+np.cbrt(1-chi))
+    Z2 = np.sqrt(3*chi2+Z1*Z1)
+    # 3-Z1 can dip marginally below zero at |chi|=1 due to round-off:
+    # clip it so that the chi=+/-1 limits (1 and 9) are handled exactly
+    return 3+Z2-np.sign(chi)*np.sqrt(np.maximum(3-Z1, 0)*(3+Z1+2*Z2))
+
+# Analytic solution for the ISSO radius at one of the poles
+def ISSO_solution_at_pole(chi):
+    """
+    Solve ISSO_eq_at_pole for the radius of the Kerr polar
+    (inclination = +/- pi/2) innermost stable spherical orbit
+    (ISSO).  The polynomial roots are obtained analytically and
+    the physical one, which lies between
+    1+sqrt[3]+sqrt[3+2sqrt[3]] and 6, is returned.
+
+    Parameters
+    ----------
+    chi: array
+        the BH dimensionless spin parameter
+
+    Returns
+    -------
+    array
+        the radius of the polar ISSO in BH mass units
+    """
+    r_min = 1+math.sqrt(3)+math.sqrt(3+2*math.sqrt(3))
+    chi2 = chi*chi
+    chi4 = chi2*chi2
+    # Solve ISSO_eq_at_pole for all samples at once as the eigenvalue
+    # problem of the stacked companion matrices of its expansion in
+    # powers of r
+    companion = np.zeros((len(chi), 6, 6))
+    companion[:, 0, 0] = 6.
+    companion[:, 0, 1] = -3*chi2
+    companion[:, 0, 2] = -4*chi2
+    companion[:, 0, 3] = -3*chi4
+    companion[:, 0, 4] = 6*chi4
+    companion[:, 0, 5] = -chi4*chi2
+    idx = np.arange(1, 6)
+    companion[:, idx, idx-1] = 1.
+    roots = np.linalg.eigvals(companion)
+    # Select the unique physical root of each sample branchlessly
+    physical = (abs(roots.imag) < 1e-8) & (roots.real >= r_min-1e-6) & \
+        (roots.real <= 6+1e-6)
+    return np.max(np.where(physical, roots.real, -np.inf), axis=1)
+
+# Generic-inclination ISSO root-find
+def _PG_ISSO_solve_generic(chi, incl, sin_incl2, rISCO_limit,
+                           rISSO_at_pole_limit):
+    """
+    Find the root of PG_ISSO_eq for samples whose inclination is
+    neither equatorial nor polar.  The physical root is bracketed
+    by the two analytic limits passed in.
+
+    Parameters
+    ----------
+    chi: array
+        the BH dimensionless spin parameter
+    incl: array
+        the inclination angle between the BH spin and the orbital
+        angular momentum in radians (used only to order samples
+        when seeding retries; the equation itself depends on the
+        inclination through sin_incl2)
+    sin_incl2: array
+        the squared sine of the inclination angle
+    rISCO_limit: array
+        the ISCO radius of each sample in BH mass units
+    rISSO_at_pole_limit: array
+        the polar ISSO radius of each sample in BH mass units
+
+    Returns
+    -------
+    array
+        the radius of the orbit in BH mass units
+    """
+    # The polynomial coefficients depend on the sample parameters
+    # only: evaluate them once, so that each Newton iteration
+    # reduces to two Horner sweeps
+    coeffs = _PG_ISSO_eq_coefficients(chi, sin_incl2)
+    # The physical root is bracketed by the two analytic limits
+    lower = np.minimum(rISCO_limit, rISSO_at_pole_limit)
+    upper = np.maximum(rISCO_limit, rISSO_at_pole_limit)
+    # _vec_newton copies its starting point, so upper can be handed
+    # over as is
+    solution, converged = _vec_newton(_PG_ISSO_eq_horner,
+                                      _PG_ISSO_eq_horner_prime,
+                                      upper, args=(coeffs,))
+    oob = ~converged | (solution < lower-1e-6) | (solution > upper+1e-6)
+    if oob.any():
+        initial_guess = lower.copy()
+        # The ISSO radius varies smoothly across parameter space, so
+        # converged solutions are excellent warm starts for failed
+        # samples: seed each of those with the solution of its nearest
+        # converged neighbour in (chi, incl) order
+        if (~oob).any():
+            order = np.lexsort((incl, chi))
+            good_pos = np.flatnonzero(~oob[order])
+            bad_pos = np.flatnonzero(oob[order])
+            nearest = np.clip(np.searchsorted(good_pos, bad_pos),
+                              0, good_pos.size-1)
+            initial_guess[order[bad_pos]] = \
+                solution[order[good_pos[nearest]]]
+        # Gather the failed samples into contiguous sub-arrays and
+        # retry only those, leaving the converged ones untouched
+        bad_idx = np.flatnonzero(oob)
+        bad_coeffs = tuple(np.ascontiguousarray(c[bad_idx])
+                           if np.ndim(c) else c for c in coeffs)
+        retry, retry_converged = _vec_newton(_PG_ISSO_eq_horner,
+                                             _PG_ISSO_eq_horner_prime,
+                                             initial_guess[bad_idx],
+                                             args=(bad_coeffs,))
+        solution[bad_idx] = retry
+        converged[bad_idx] = retry_converged
+    # Any sample that still resists the Newton sweeps (or converged
+    # to a root outside the physical range) is solved with a
+    # bracketed method: the physical root is known a priori to lie
+    # between the two analytic limits, so no guess/retry ladder is
+    # needed
+    bad = ~converged | (solution < lower-1e-6) | (solution > upper+1e-6)
+    for i in np.flatnonzero(bad):
+        coeffs_i = tuple(c[i] if np.ndim(c) else c for c in coeffs)
+        a = lower[i]-1e-9
+        b = upper[i]+1e-9
+        f_a = _PG_ISSO_eq_horner(a, coeffs_i)
+        f_b = _PG_ISSO_eq_horner(b, coeffs_i)
+        if np.sign(f_a) != np.sign(f_b):
+            solution[i] = scipy.optimize.brentq(_PG_ISSO_eq_horner, a, b,
+                                                args=(coeffs_i,),
+                                                xtol=1e-10)
+            continue
+        # The polynomial can have the same sign at both bracket ends:
+        # at chi^2 = 1 the lower limit sits at r = 1, which is an
+        # exact root of the polynomial, so the endpoint value is pure
+        # cancellation noise of arbitrary sign, and within ~1e-4 of a
+        # polar inclination a pair of branch roots can fall between
+        # the same two endpoints.  Scan the bracket for an interior
+        # sign change and bisect the sub-interval that matches the
+        # orbital branch: prograde solutions are the innermost root
+        # in the bracket, retrograde ones the outermost
+        grid = np.linspace(a, b, 256)
+        values = _PG_ISSO_eq_horner(grid, coeffs_i)
+        crossings = np.flatnonzero(np.sign(values[:-1])
+                                   != np.sign(values[1:]))
+        if crossings.size:
+            prograde = math.cos(incl[i])*chi[i] >= 0
+            k = crossings[0] if prograde else crossings[-1]
+            solution[i] = scipy.optimize.brentq(_PG_ISSO_eq_horner,
+                                                grid[k], grid[k+1],
+                                                args=(coeffs_i,),
+                                                xtol=1e-10)
+        else:
+            # No sign change anywhere across the bracket: the root is
+            # tangent to the axis (at chi^2 = 1 it coincides with the
+            # r = 1 endpoint), so the point of smallest residual is
+            # the root to machine accuracy
+            solution[i] = grid[np.argmin(abs(values))]
+    return solution
+
 # ISSO radius solver
 def PG_ISSO_solver(chi,incl):
     """Function that determines the radius of the innermost stable
     spherical orbit (ISSO) for a Kerr BH and a generic inclination
     angle between the BH spin and the orbital angular momentum.
-    This function finds the appropriat root of PG_ISSO_eq.
+    The equatorial and polar limits are known analytically; for a
+    generic inclination this function finds the appropriate root
+    of PG_ISSO_eq.
 
     Parameters
     ----------
-    chi: float
+    chi: float or array
         the BH dimensionless spin parameter
-    incl: float
+    incl: float or array
         the inclination angle between the BH spin and the orbital
         angular momentum in radians
 
     Returns
     -------
-    solution: float
+    solution: float or array
         the radius of the orbit in BH mass units
     """
+    chi = np.asarray(chi, dtype=np.float64)
+    incl = np.asarray(incl, dtype=np.float64)
+    chi, incl = np.broadcast_arrays(chi, incl)
+    scalar_input = chi.ndim == 0
+    # The root-find works on a flat batch; the broadcast shape is
+    # restored on the way out
+    input_shape = chi.shape
+    chi = np.atleast_1d(chi).ravel()
+    incl = np.atleast_1d(incl).ravel()
+
     # Auxiliary variables
-    cos_incl=math.cos(incl)
+    cos_incl = np.cos(incl)
     sgnchi = np.sign(cos_incl)*chi
 
-    # ISCO radius for the given spin magnitude
-    if sgnchi > 0.99:
-        initial_guess = 2 # Works better than 6 for chi=1
-    elif sgnchi < 0:
-        initial_guess = 9
-    else:
-        initial_guess = 5 # Works better than 6 for chi=0.5
-    rISCO_limit = scipy.optimize.fsolve(ISCO_eq, initial_guess, args=sgnchi)
+    # ISCO radius for the given signed spin magnitude
+    rISCO_limit = ISCO_solution(sgnchi)
 
     # ISSO radius for an inclination of pi/2
-    if chi < 0:
-        initial_guess = 9
-    else:
-        initial_guess = 6
-    rISSO_at_pole_limit = scipy.optimize.fsolve(ISSO_eq_at_pole, initial_guess,
-                                                args=chi)
-
-    # If the inclination is 0 or pi, just output the ISCO radius
-    if incl in [0, math.pi]:
-        solution = rISCO_limit
-    # If the inclination is pi/2, just output the ISSO radius at the pole(s)
-    elif incl == math.pi/2:
-        solution = rISSO_at_pole_limit
-    # Otherwise, find the ISSO radius for a generic inclination
-    else:
-        initial_guess = max(rISCO_limit,rISSO_at_pole_limit)
-        solution = scipy.optimize.fsolve(PG_ISSO_eq, initial_guess,
-                                         args=(chi, incl))
-        if solution < 1 or solution > 9:
-            initial_guess = min(rISCO_limit,rISSO_at_pole_limit)
-            solution = scipy.optimize.fsolve(PG_ISSO_eq, initial_guess,
-                                             args=(chi, incl))
-
-    return solution
+    rISSO_at_pole_limit = ISSO_solution_at_pole(chi)
+
+    # Samples at an inclination of 0 or pi take the ISCO radius and
+    # samples at an inclination of pi/2 take the polar ISSO radius;
+    # the generic root-find runs only on the samples that need it,
+    # rather than on everything as soon as one mixed inclination is
+    # present
+    equatorial = (incl == 0) | (incl == math.pi)
+    polar = incl == math.pi/2
+    solution = np.where(polar, rISSO_at_pole_limit, rISCO_limit)
+    generic = ~(equatorial | polar)
+    if generic.any():
+        # cos_incl is already in hand, so the squared sine comes from
+        # the 1-cos^2 identity rather than a second transcendental
+        sin_incl2 = 1.0 - cos_incl*cos_incl
+        solution[generic] = _PG_ISSO_solve_generic(
+            chi[generic], incl[generic], sin_incl2[generic],
+            rISCO_limit[generic], rISSO_at_pole_limit[generic])
+
+    if scalar_input:
+        return float(solution[0])
+    return solution.reshape(input_shape)
 
 ##############################################################################
 # 2H 2-piecewise polytropic EOS, NS non-rotating equilibrium sequence        #
@@ -180,12 +541,17 @@ def PG_ISSO_solver(chi,incl):
 # Eventually, the function should call an NS sequence generator within LAL   #
 # the EOS prescribed by the user and store it.                               #
 ##############################################################################
+@functools.lru_cache(maxsize=None)
 def load_ns_sequence(eos_name):
     """
     Load the data of an NS non-rotating equilibrium sequence
     generated using the equation of state (EOS) chosen by the
     user.  [Only the 2H 2-piecewise polytropic EOS is currently
     supported.  This yields NSs with large radiss (15-16km).]
+    The sequences are immutable reference tables, so the result
+    is memoized and repeated calls are free.  The first parse of
+    the ASCII table is stored as a binary .npy sidecar next to it
+    (when the directory is writable) to speed up later processes.
 
     Parameters
     -----------
@@ -208,7 +574,28 @@ def load_ns_sequence(eos_name):
 
     if eos_name == '2H':
         ns_sequence_path = os.path.join(pycbc.tmpltbank.NS_SEQUENCE_FILE_DIRECTORY, 'equil_2H.dat')
-        ns_sequence = np.loadtxt(ns_sequence_path)
+        ns_sequence_npy = os.path.splitext(ns_sequence_path)[0]+'.npy'
+        if os.path.isfile(ns_sequence_npy) and \
+                os.path.getmtime(ns_sequence_npy) >= \
+                os.path.getmtime(ns_sequence_path):
+            ns_sequence = np.load(ns_sequence_npy)
+        else:
+            ns_sequence = np.loadtxt(ns_sequence_path)
+            # Write the sidecar to a temporary file and move it into
+            # place atomically: concurrent jobs may be reading the final
+            # path, and a partial or failed write must never be left
+            # behind under the real name
+            tmp_path = '%s.tmp-%d.npy' % (ns_sequence_npy, os.getpid())
+            try:
+                np.save(tmp_path, ns_sequence)
+                os.replace(tmp_path, ns_sequence_npy)
+            except OSError:
+                # The data directory may not be writable (e.g. a system
+                # install) or full: just skip the binary sidecar
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
     else:
         err_msg = "Only the 2H EOS is currently supported."
         err_msg += "If you plan to use a different NS EOS,"
@@ -217,10 +604,52 @@ def load_ns_sequence(eos_name):
         sys.exit(1)
         raise Exception('Unsupported EOS!')
 
-    max_ns_g_mass = max(ns_sequence[:,0])
+    max_ns_g_mass = float(ns_sequence[:,0].max())
 
     return (ns_sequence, max_ns_g_mass)
 
+##############################################################################
+# Contiguous copies of the columns of an NS equilibrium sequence are cached  #
+# so that repeated lookups over the same sequence reduce to a plain linear   #
+# interpolation over dense arrays.                                           #
+##############################################################################
+_ns_sequence_columns = {}
+
+def _get_ns_columns(ns_sequence):
+    """
+    Return (cached) contiguous copies of the NS gravitational
+    mass, baryonic mass and compactness columns of the given
+    equilibrium sequence.
+
+    Parameters
+    -----------
+    ns_sequence: 3D-array
+        contains the sequence data in the form NS gravitational
+         mass (in solar masses), NS baryonic mass (in solar
+         masses), NS compactness (dimensionless)
+
+    Returns
+    ----------
+    tuple of arrays
+        the gravitational mass, baryonic mass and compactness
+        columns
+    """
+    key = (id(ns_sequence), ns_sequence.shape,
+           float(ns_sequence[0, 0]), float(ns_sequence[-1, 0]))
+    try:
+        return _ns_sequence_columns[key]
+    except KeyError:
+        if len(_ns_sequence_columns) > 8:
+            _ns_sequence_columns.clear()
+        # Copy each column into its own contiguous array: column slices
+        # of the 2D sequence are strided views, which would otherwise be
+        # walked on every lookup
+        columns = (np.ascontiguousarray(ns_sequence[:, 0]),
+                   np.ascontiguousarray(ns_sequence[:, 1]),
+                   np.ascontiguousarray(ns_sequence[:, 2]))
+        _ns_sequence_columns[key] = columns
+        return columns
+
 ##############################################################################
 # Given an NS equilibrium sequence and gravitational mass (in Msun), return  #
 # the NS baryonic mass (in Msun).                                            #
@@ -245,11 +674,12 @@ def ns_g_mass_to_ns_b_mass(ns_g_mass, ns_sequence):
         The NS baryonic mass (in solar massesr**3*(r**2*(r-6)+chi**2*(3*r+4))+
         chi**4*(3*r*(r-2)+chi**2))
     """
-    x = ns_sequence[:,0]
-    y = ns_sequence[:,1]
-    f = scipy.interpolate.interp1d(x, y)
+    ns_g_mass_column, ns_b_mass_column, _ = _get_ns_columns(ns_sequence)
 
-    return f(ns_g_mass)
+    # Masses outside the tabulated sequence yield NaN rather than a
+    # silently clamped end value
+    return np.interp(ns_g_mass, ns_g_mass_column, ns_b_mass_column,
+                     left=np.nan, right=np.nan)
 
 ##############################################################################
 # Given an NS equilibrium sequence and gravitational mass (in Msun), return  #
@@ -274,11 +704,12 @@ def ns_g_mass_to_ns_compactness(ns_g_mass, ns_sequence):
     float
         The NS compactness (dimensionless)
     """
-    x = ns_sequence[:,0]
-    y = ns_sequence[:,2]
-    f = scipy.interpolate.interp1d(x, y)
+    ns_g_mass_column, _, compactness_column = _get_ns_columns(ns_sequence)
 
-    return f(ns_g_mass)
+    # Masses outside the tabulated sequence yield NaN rather than a
+    # silently clamped end value
+    return np.interp(ns_g_mass, ns_g_mass_column, compactness_column,
+                     left=np.nan, right=np.nan)
 
 ##############################################################################
 # NS-BH merger remnant mass [Foucart, Hinderer, Nissanke PRD 98, 081501(R)   #
@@ -320,8 +751,52 @@ def remnant_mass(eta, ns_g_mass, ns_sequence, chi, incl):
         The remnant mass in solar masses
     """
 
+    return float(remnant_masses(eta, ns_g_mass, ns_sequence, chi, incl))
+
+
+#############################################################################
+# Vectorized version of remnant_mass. The third argument (NS equilibrium    #
+# sequence) is excluded from vectorisation.                                 #
+#############################################################################
+def remnant_masses(eta, ns_g_mass, ns_sequence, chi, incl):
+    """
+    Function that determines the remnant disk masses of a set of
+    NS-BH systems using the fit to numerical-relativity results
+    discussed in Foucart, Hinderer, Nissanke PRD 98, 081501(R)
+    (2018).  All samples are processed at once through the
+    vectorized ISSO solver and sequence lookups.
+
+    Parameters
+    -----------
+    eta: float or array
+        the symmetric mass ratio of the binary
+    ns_g_mass: float or array
+        NS gravitational mass (in solar masses)
+    ns_sequence: 3D-array
+        contains the sequence data in the form NS gravitational
+         mass (in solar masses), NS baryonic mass (in solar
+         masses), NS compactness (dimensionless)
+    chi: float or array
+        the BH dimensionless spin parameter
+    incl: float or array
+        the inclination angle between the BH spin and the orbital
+        angular momentum in radians
+
+    Returns
+    ----------
+    remnant_mass: float or array
+        The remnant mass in solar masses
+    """
+    eta = np.asarray(eta, dtype=np.float64)
+    ns_g_mass = np.asarray(ns_g_mass, dtype=np.float64)
+    chi = np.asarray(chi, dtype=np.float64)
+    incl = np.asarray(incl, dtype=np.float64)
+    eta, ns_g_mass, chi, incl = np.broadcast_arrays(eta, ns_g_mass,
+                                                    chi, incl)
+
     # Sanity checks on eta and chi
-    if not (eta>0. and eta<=0.25 and abs(chi)<=1 and ns_g_mass>0):
+    if not (np.all(eta > 0.) and np.all(eta <= 0.25)
+            and np.all(abs(chi) <= 1) and np.all(ns_g_mass > 0)):
         err_msg = "The BH spin magnitude must be <= 1,"
         err_msg += "eta must be between 0 and 0.25,"
         err_msg += "and the NS mass must be positive."
@@ -336,6 +811,14 @@ def remnant_mass(eta, ns_g_mass, ns_sequence, chi, incl):
     # NS compactness and rest mass
     ns_compactness = ns_g_mass_to_ns_compactness(ns_g_mass, ns_sequence)
     ns_b_mass = ns_g_mass_to_ns_b_mass(ns_g_mass, ns_sequence)
+    if not (np.all(np.isfinite(ns_compactness))
+            and np.all(np.isfinite(ns_b_mass))):
+        err_msg = "The NS gravitational mass must lie within the "
+        err_msg += "tabulated equilibrium sequence: it cannot exceed "
+        err_msg += "the maximum stable NS mass of the EOS.\n"
+        logging.error(err_msg)
+        sys.exit(1)
+        raise Exception('Unphysical parameters!')
 
     # Fit parameters and tidal correction
     alpha = 0.406
@@ -343,18 +826,11 @@ def remnant_mass(eta, ns_g_mass, ns_sequence, chi, incl):
     gamma = 0.255
     delta = 1.761
     # The remnant mass over the NS rest mass
-    remnant_mass = (max(alpha/eta**(1./3.)*(1 - 2*ns_compactness)
-                        - beta*ns_compactness / eta*PG_ISSO_solver(chi, incl)
-                        + gamma, 0.)) ** delta
+    remnant_mass = np.maximum(alpha/eta**(1./3.)*(1 - 2*ns_compactness)
+                              - beta*ns_compactness / eta
+                              * PG_ISSO_solver(chi, incl)
+                              + gamma, 0.) ** delta
     # Convert to solar masses
     remnant_mass = remnant_mass*ns_b_mass
 
     return remnant_mass
-
-
-#############################################################################
-# Vectorized version of remnant_mass. The third argument (NS equilibrium    #
-# sequence) is excluded from vectorisation.                                 #
-#############################################################################
-remnant_masses = np.vectorize(remnant_mass)
-remnant_masses.excluded.add(2)
@@ -543,8 +543,146 @@ class TmpltbankTestClass(unittest.TestCase):
     def tearDown(self):
         pass
 
+class EMProgenitorsTestClass(unittest.TestCase):
+    def setUp(self):
+        self.ns_sequence, self.max_ns_g_mass = \
+            pycbc.tmpltbank.load_ns_sequence('2H')
+
+    def test_isso_analytic_limits(self):
+        # Known equatorial (ISCO) radii: Schwarzschild and extreme Kerr,
+        # prograde and retrograde
+        self.assertAlmostEqual(pycbc.tmpltbank.PG_ISSO_solver(0., 0.), 6.)
+        self.assertAlmostEqual(pycbc.tmpltbank.PG_ISSO_solver(1., 0.), 1.)
+        self.assertAlmostEqual(pycbc.tmpltbank.PG_ISSO_solver(-1., 0.), 9.)
+        # An aligned orbit around a flipped spin is retrograde
+        self.assertAlmostEqual(pycbc.tmpltbank.PG_ISSO_solver(1., math.pi),
+                               9.)
+        # Polar solutions solve ISSO_eq_at_pole and lie in the known range
+        r_min = 1 + math.sqrt(3) + math.sqrt(3 + 2*math.sqrt(3))
+        for chi in [0., 0.3, 0.7, 1.]:
+            sol = pycbc.tmpltbank.PG_ISSO_solver(chi, math.pi/2)
+            self.assertTrue(r_min - 1e-6 <= sol <= 6 + 1e-6)
+            self.assertAlmostEqual(
+                pycbc.tmpltbank.ISSO_eq_at_pole(sol, chi), 0., places=5)
+
+    def test_isso_generic_roots(self):
+        # Over a (chi, incl) grid the solver output must be a root of
+        # PG_ISSO_eq lying between the equatorial and polar limits
+        chi, incl = numpy.meshgrid(numpy.linspace(-1, 1, 21),
+                                   numpy.linspace(0.05, math.pi - 0.05, 21))
+        chi = chi.flatten()
+        incl = incl.flatten()
+        solution = pycbc.tmpltbank.PG_ISSO_solver(chi, incl)
+        residual = pycbc.tmpltbank.PG_ISSO_eq(solution, chi, incl)
+        slope = pycbc.tmpltbank.PG_ISSO_eq_prime(solution, chi, incl)
+        # abs(residual/slope) bounds the distance from the true root
+        self.assertTrue(numpy.all(numpy.abs(residual) <=
+                                  1e-5*numpy.maximum(numpy.abs(slope), 1.)))
+        self.assertTrue(numpy.all(solution >= 1 - 1e-6))
+        self.assertTrue(numpy.all(solution <= 9 + 1e-6))
+
+    def test_isso_bracket_edge_cases(self):
+        # Parameters for which PG_ISSO_eq does not change sign across
+        # the widened analytic bracket: at chi^2 = 1 both of these are
+        # effectively extremal prograde configurations whose root sits
+        # on the r = 1 end of the bracket itself
+        for chi, incl in [(1.0, 0.2021), (-1.0, 3.0916)]:
+            sol = pycbc.tmpltbank.PG_ISSO_solver(chi, incl)
+            self.assertTrue(isinstance(sol, float))
+            self.assertAlmostEqual(sol, 1.0, places=2)
+        # An inclination within ~1e-4 of pi/2 (but not exactly equal)
+        # must track the polar solution, also when mixed into a batch
+        chi = numpy.array([0.6, 1.0, -1.0])
+        incl = numpy.array([1.5708, 0.2021, 3.0916])
+        batch = pycbc.tmpltbank.PG_ISSO_solver(chi, incl)
+        residual = pycbc.tmpltbank.PG_ISSO_eq(batch, chi, incl)
+        slope = pycbc.tmpltbank.PG_ISSO_eq_prime(batch, chi, incl)
+        self.assertTrue(numpy.all(numpy.abs(residual) <=
+                                  1e-5*numpy.maximum(numpy.abs(slope), 1.)))
+        self.assertAlmostEqual(
+            batch[0], pycbc.tmpltbank.PG_ISSO_solver(0.6, math.pi/2),
+            places=3)
+
+    def test_isso_scalar_array_consistency(self):
+        chi = numpy.array([0.5, 0.3, -0.8, 0., 1.])
+        incl = numpy.array([1.0, 0., math.pi/2, 2.5, 0.3])
+        batch = pycbc.tmpltbank.PG_ISSO_solver(chi, incl)
+        for idx in range(len(chi)):
+            # Scalar calls, including tilted-spin ones, must match the
+            # batched result
+            scalar = pycbc.tmpltbank.PG_ISSO_solver(chi[idx], incl[idx])
+            self.assertTrue(isinstance(scalar, float))
+            self.assertAlmostEqual(scalar, batch[idx])
+            # Single-element batches must work too
+            single = pycbc.tmpltbank.PG_ISSO_solver(chi[idx:idx+1],
+                                                    incl[idx:idx+1])
+            self.assertEqual(len(single), 1)
+            self.assertAlmostEqual(single[0], batch[idx])
+        # Multi-dimensional inputs come back in their broadcast shape
+        grid = pycbc.tmpltbank.PG_ISSO_solver(chi[:4].reshape(2, 2),
+                                              incl[:4].reshape(2, 2))
+        self.assertEqual(grid.shape, (2, 2))
+        for idx in range(4):
+            self.assertAlmostEqual(grid.flatten()[idx], batch[idx])
+        # Scalars broadcast against arrays
+        broadcast = pycbc.tmpltbank.PG_ISSO_solver(0.5, incl)
+        for idx in range(len(incl)):
+            self.assertAlmostEqual(
+                broadcast[idx], pycbc.tmpltbank.PG_ISSO_solver(0.5,
+                                                               incl[idx]))
+
+    def test_remnant_mass(self):
+        # Scalar evaluation with a tilted spin and consistency with the
+        # vectorized form
+        eta = numpy.array([0.1, 0.2, 0.16])
+        ns_g_mass = numpy.array([1.4, 1.35, 1.6])
+        chi = numpy.array([0.9, 0.5, -0.3])
+        incl = numpy.array([0.7, 0., 1.2])
+        batch = pycbc.tmpltbank.remnant_masses(eta, ns_g_mass,
+                                               self.ns_sequence, chi, incl)
+        self.assertTrue(numpy.all(batch >= 0))
+        for idx in range(len(eta)):
+            scalar = pycbc.tmpltbank.remnant_mass(
+                eta[idx], ns_g_mass[idx], self.ns_sequence, chi[idx],
+                incl[idx])
+            self.assertAlmostEqual(scalar, batch[idx])
+        # 2-D inputs broadcast against each other and keep their shape
+        square = pycbc.tmpltbank.remnant_masses(
+            0.2, 1.4, self.ns_sequence, chi.reshape(3, 1),
+            incl.reshape(1, 3))
+        self.assertEqual(square.shape, (3, 3))
+        self.assertAlmostEqual(
+            square[0, 0], pycbc.tmpltbank.remnant_mass(
+                0.2, 1.4, self.ns_sequence, chi[0], incl[0]))
+        # A large aligned spin must disrupt the NS more than a large
+        # anti-aligned one
+        self.assertTrue(
+            pycbc.tmpltbank.remnant_mass(0.2, 1.4, self.ns_sequence,
+                                         0.9, 0.) >
+            pycbc.tmpltbank.remnant_mass(0.2, 1.4, self.ns_sequence,
+                                         -0.9, 0.))
+
+    def test_ns_sequence_range(self):
+        # In-range lookups are finite, out-of-range lookups must not be
+        # silently clamped to the end of the table
+        self.assertTrue(numpy.isfinite(
+            pycbc.tmpltbank.ns_g_mass_to_ns_b_mass(1.4, self.ns_sequence)))
+        self.assertTrue(numpy.isnan(
+            pycbc.tmpltbank.ns_g_mass_to_ns_b_mass(
+                self.max_ns_g_mass + 0.5, self.ns_sequence)))
+        self.assertTrue(numpy.isnan(
+            pycbc.tmpltbank.ns_g_mass_to_ns_compactness(
+                self.max_ns_g_mass + 0.5, self.ns_sequence)))
+        with self.assertRaises(SystemExit):
+            pycbc.tmpltbank.remnant_mass(0.2, self.max_ns_g_mass + 0.5,
+                                         self.ns_sequence, 0.5, 0.)
+
+    def tearDown(self):
+        pass
+
 suite = unittest.TestSuite()
 suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TmpltbankTestClass))
+suite.addTest(unittest.TestLoader().loadTestsFromTestCase(EMProgenitorsTestClass))
 
 if  __name__ == '__main__':
     results = unittest.TextTestRunner(verbosity=2).run(suite)